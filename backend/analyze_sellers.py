@@ -1,38 +1,61 @@
 #!/usr/bin/env python3
-import json
-from collections import Counter, defaultdict
+"""
+Análisis de productos por vendedor
 
-# Cargar datos de productos
-with open('app/data/products.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+Uso: python analyze_sellers.py [ruta] [--resumen]
+     ruta: products.json o NDJSON (default: app/data/products.json)
 
-products = data['products']
+Los agregados se calculan en una sola pasada sin guardar los productos. Para
+listar los títulos de cada vendedor se usa el Catalog (registros JSON compactos),
+cuya memoria crece con el tamaño del catálogo; con --resumen se omite ese listado
+y solo se conservan los agregados (que incluyen los IDs de producto por vendedor).
+"""
+import sys
 
-# Analizar vendedores
-sellers = defaultdict(list)
-for product in products:
-    seller_name = product['seller']['name']
-    sellers[seller_name].append({
-        'id': product['id'],
-        'title': product['title'][:50] + '...' if len(product['title']) > 50 else product['title']
-    })
+from app.catalog import DEFAULT_DATA_PATH, Catalog
+from app.loader import iter_products
+from app.seller_analytics import SellerAnalytics
+
+args = [arg for arg in sys.argv[1:] if arg != "--resumen"]
+summary_only = "--resumen" in sys.argv[1:]
+data_path = args[0] if args else DEFAULT_DATA_PATH
+
+if summary_only:
+    # Calcular agregados en una sola pasada sobre el archivo
+    catalog = None
+    analytics = SellerAnalytics(iter_products(data_path))
+else:
+    # El catálogo calcula los mismos agregados al cargar y permite buscar títulos por ID
+    catalog = Catalog(data_path)
+    catalog.refresh()
+    analytics = catalog.sellers
+# El reporte agrupa por nombre (como los productos relacionados), no por ID
+sellers = analytics.grouped_by_name()
 
 print("ANÁLISIS DE PRODUCTOS POR VENDEDOR")
 print("=" * 50)
-print(f"Total productos: {len(products)}")
+print(f"Total productos: {sum(seller.products_count for seller in sellers)}")
 print(f"Total vendedores: {len(sellers)}")
 print()
 
 # Mostrar vendedores y sus productos
-for seller_name, seller_products in sorted(sellers.items()):
-    print(f"{seller_name}: {len(seller_products)} productos")
-    for product in seller_products:
-        print(f"  - ID {product['id']}: {product['title']}")
+for seller in sellers:
+    print(f"{seller.name} ({seller.id}): {seller.products_count} productos")
+    print(f"  GMV aproximado: {seller.gmv:,.0f} | Vendidos: {seller.sold_quantity} | "
+          f"Calificación promedio: {seller.average_rating}")
+    print(f"  Calificaciones: {dict(sorted(seller.rating_distribution.items()))}")
+    print(f"  Categorías: {dict(seller.category_mix.most_common())}")
+    if catalog is not None:
+        # Listar en el orden del archivo
+        product_ids = sorted(seller.product_ids, key=catalog.snapshot.index.__getitem__)
+        for product in catalog.products_by_ids(product_ids):
+            title = product['title']
+            print(f"  - ID {product['id']}: {title[:50] + '...' if len(title) > 50 else title}")
     print()
 
 # Vendedores con menos de 3 productos
-insufficient_sellers = {k: v for k, v in sellers.items() if len(v) < 3}
+insufficient_sellers = [seller for seller in sellers if seller.products_count < 3]
 print("VENDEDORES CON MENOS DE 3 PRODUCTOS:")
 print("=" * 40)
-for seller_name, seller_products in insufficient_sellers.items():
-    print(f"{seller_name}: {len(seller_products)} productos (necesita {3 - len(seller_products)} más)")
\ No newline at end of file
+for seller in insufficient_sellers:
+    print(f"{seller.name}: {seller.products_count} productos (necesita {3 - seller.products_count} más)")
@@ -0,0 +1,137 @@
+# app/catalog.py
+"""
+Catálogo de productos en memoria con recarga automática
+
+El archivo de datos se carga de forma incremental (ver app/loader.py) y se vuelve
+a cargar solo cuando cambia en disco. Cada producto se guarda como JSON compacto
+y se decodifica únicamente cuando se necesita; los filtros y ordenamientos usan
+las columnas de app/columns.py. Registros, columnas e índice forman una
+instantánea inmutable que se reemplaza completa en cada recarga. En cada recarga
+se calculan los productos agregados/eliminados para actualizar los agregados de
+vendedores de forma incremental.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .loader import CatalogSnapshot, load_catalog_file
+from .models import QuarantinedProduct
+from .seller_analytics import SellerAnalytics
+
+logger = logging.getLogger(__name__)
+
+# Ruta por defecto del catálogo; puede reemplazarse con la variable de entorno CATALOG_DATA_PATH
+DEFAULT_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "products.json")
+
+
+class Catalog:
+    """
+    Catálogo compartido: mantiene la instantánea (CatalogSnapshot) de la última
+    carga válida, los agregados de vendedores y detecta cambios en el archivo
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Se reemplaza completa en cada recarga; quien necesite filas y registros
+        # consistentes debe tomar esta referencia una sola vez
+        self.snapshot = CatalogSnapshot()
+        self.sellers = SellerAnalytics()
+        self.loaded = False
+        self.loaded_at: Optional[datetime] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.snapshot)
+
+    @property
+    def payment_methods(self) -> dict:
+        return self.snapshot.payment_methods
+
+    @property
+    def quarantine(self) -> List[QuarantinedProduct]:
+        return self.snapshot.quarantine
+
+    def get(self, product_id: int) -> Optional[dict]:
+        """Retorna el producto con el ID indicado, o None si no existe"""
+        return self.snapshot.get(product_id)
+
+    def products_by_ids(self, product_ids: Iterable[int]) -> Iterator[dict]:
+        """Recorre los productos con los IDs indicados, omitiendo los inexistentes"""
+        return self.snapshot.products_by_ids(product_ids)
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """Fecha de modificación y tamaño del archivo, usados para detectar cambios"""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> bool:
+        """
+        Recarga el catálogo si el archivo cambió desde la última carga
+        Retorna: True si hubo recarga
+        Lanza: FileNotFoundError o json.JSONDecodeError si la carga inicial falla
+        """
+        with self._lock:
+            try:
+                signature = self._file_signature()
+                if self.loaded and signature == self._signature:
+                    return False
+                loaded = load_catalog_file(self.path)
+            except Exception:
+                # Si ya hay datos cargados, se siguen sirviendo los anteriores
+                # (los productos inválidos no llegan aquí: quedan en cuarentena)
+                if self.loaded:
+                    logger.exception(f"No se pudo recargar el catálogo {self.path}")
+                    return False
+                raise
+
+            changed = self._apply_seller_changes(loaded)
+            self.snapshot = loaded
+            self._signature = signature
+            self.loaded = True
+            self.loaded_at = datetime.now()
+            logger.info(
+                f"Catálogo cargado: {len(loaded)} productos, {changed} con cambios, "
+                f"{len(self.quarantine)} en cuarentena"
+            )
+            return True
+
+    def _apply_seller_changes(self, loaded: CatalogSnapshot) -> int:
+        """
+        Actualiza los agregados de vendedores solo con los productos que cambiaron
+        Los registros se comparan como bytes y solo los distintos se decodifican
+        Retorna: cantidad de productos nuevos, modificados o eliminados
+        """
+        old, records, index = self.snapshot, loaded.records, loaded.index
+
+        def old_record(product_id: int) -> Optional[bytes]:
+            position = old.index.get(product_id)
+            return None if position is None else old.records[position]
+
+        # Lista para conservar el orden del archivo; conjunto para búsquedas rápidas
+        added = [pid for pid, pos in index.items() if old_record(pid) != records[pos]]
+        added_ids = set(added)
+        removed = [pid for pid in old.index if pid not in index or pid in added_ids]
+        self.sellers.apply_changes(
+            added=(json.loads(records[index[pid]]) for pid in added),
+            removed=(json.loads(old_record(pid)) for pid in removed),
+        )
+        return len(added_ids.union(removed))
+
+
+_catalog: Optional[Catalog] = None
+
+
+def get_catalog() -> Catalog:
+    """
+    Retorna el catálogo compartido, recargándolo si el archivo de datos cambió
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = Catalog(os.environ.get("CATALOG_DATA_PATH", DEFAULT_DATA_PATH))
+    _catalog.refresh()
+    return _catalog
@@ -0,0 +1,228 @@
+# app/columns.py
+"""
+Almacenamiento columnar de los campos más consultados del catálogo
+
+Cada campo numérico se guarda en un array compacto (array.array) y los campos
+de texto con pocos valores distintos (vendedor, marca, condición, moneda) se
+codifican como diccionario: un array de códigos enteros más la lista de valores
+únicos. Los filtros y ordenamientos recorren solo estas columnas; el producto
+completo se decodifica únicamente para las filas que se retornan.
+
+Si NumPy está instalado, las columnas se exponen como vistas sin copia
+(np.frombuffer) y los filtros se evalúan de forma vectorizada.
+"""
+
+import math
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan recorridos en Python puro
+    np = None
+
+# Columnas numéricas y su tipo en array ("d" = float64, "q" = int64)
+# Los campos opcionales usan float64 y guardan NaN cuando no tienen valor
+NUMERIC_COLUMNS = {
+    "price": "d",
+    "original_price": "d",
+    "discount_percentage": "d",
+    "rating": "d",
+    "reviews_count": "q",
+    "sold_quantity": "q",
+    "available_quantity": "q",
+}
+
+# Columnas por las que se puede ordenar un listado
+SORTABLE_COLUMNS = ("price", "rating", "sold_quantity", "reviews_count", "discount_percentage")
+
+
+class DictionaryColumn:
+    """
+    Columna de texto codificada como diccionario: cada fila guarda el código del valor
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes = array("I")
+        self._lookup: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def append(self, value: Optional[str]):
+        value = value or ""
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def code_of(self, value: str) -> Optional[int]:
+        """Retorna el código de un valor, o None si ninguna fila lo tiene"""
+        return self._lookup.get(value)
+
+
+class CatalogColumns:
+    """
+    Columnas del catálogo alineadas por fila con los registros compactos
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.numeric: Dict[str, array] = {name: array(code) for name, code in NUMERIC_COLUMNS.items()}
+        self.seller_id = DictionaryColumn()
+        self.seller_name = DictionaryColumn()
+        self.brand = DictionaryColumn()
+        self.condition = DictionaryColumn()
+        self.currency = DictionaryColumn()
+        # Título y descripción en minúsculas, usados por la búsqueda de texto
+        self.search_text: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _all_columns(self) -> list:
+        """Todas las secuencias por fila, para agregar o revertir filas de forma uniforme"""
+        return [
+            self.ids, *self.numeric.values(), self.search_text,
+            *(column.codes for column in
+              (self.seller_id, self.seller_name, self.brand, self.condition, self.currency)),
+        ]
+
+    def append(self, product: dict):
+        """
+        Agrega una fila con los campos de un producto ya validado
+        Si algún valor no cabe en su columna (ej: un entero mayor a 64 bits) no se
+        agrega nada y se propaga el error (TypeError, ValueError u OverflowError)
+        """
+        row = len(self)
+        try:
+            self.ids.append(product["id"])
+            for name, column in self.numeric.items():
+                value = product.get(name)
+                column.append(math.nan if value is None else value)
+            self.seller_id.append(product["seller"]["id"])
+            self.seller_name.append(product["seller"]["name"])
+            self.brand.append((product.get("category") or {}).get("brand"))
+            self.condition.append(product.get("condition"))
+            self.currency.append(product.get("currency"))
+            self.search_text.append(f"{product['title']}\n{product['description']}".lower())
+        except Exception:
+            # Revertir la fila parcial para mantener las columnas alineadas
+            for column in self._all_columns():
+                del column[row:]
+            raise
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por los buffers de las columnas numéricas y de códigos"""
+        buffers = [column for column in self._all_columns() if isinstance(column, array)]
+        return sum(buffer.itemsize * len(buffer) for buffer in buffers)
+
+    def rows_with(self, column: DictionaryColumn, value: str, equal: bool = True) -> List[int]:
+        """Filas cuyo valor en una columna de diccionario es (o no es) igual a `value`"""
+        code = column.code_of(value)
+        if code is None:
+            return [] if equal else list(range(len(self)))
+        if np is not None:
+            codes = np.frombuffer(column.codes, dtype=np.uint32)
+            mask = codes == code if equal else codes != code
+            return np.flatnonzero(mask).tolist()
+        return [row for row, row_code in enumerate(column.codes) if (row_code == code) == equal]
+
+    def select(
+        self,
+        search: Optional[str] = None,
+        condition: Optional[str] = None,
+        seller_id: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+    ) -> List[int]:
+        """
+        Filtra y ordena las filas usando solo las columnas
+        Retorna: lista de filas (posiciones en los registros) en el orden final
+        """
+        # La condición se compara sin distinguir mayúsculas, igual que en la exportación
+        condition_codes = None
+        if condition:
+            condition_codes = [
+                code for code, value in enumerate(self.condition.values)
+                if value.lower() == condition.lower()
+            ]
+        seller_code = -1
+        if seller_id:
+            code = self.seller_id.code_of(seller_id)
+            seller_code = -1 if code is None else code
+
+        if np is not None:
+            rows = self._select_numpy(search, condition_codes, seller_id, seller_code, min_price, max_price)
+        else:
+            rows = self._select_python(search, condition_codes, seller_id, seller_code, min_price, max_price)
+
+        if sort_by:
+            rows = self.sort(rows, sort_by, descending)
+        return rows
+
+    def _select_numpy(self, search, condition_codes, seller_id, seller_code, min_price, max_price) -> List[int]:
+        mask = np.ones(len(self), dtype=bool)
+        price = np.frombuffer(self.numeric["price"], dtype=np.float64)
+        if min_price is not None:
+            mask &= price >= min_price
+        if max_price is not None:
+            mask &= price <= max_price
+        if condition_codes is not None:
+            mask &= np.isin(np.frombuffer(self.condition.codes, dtype=np.uint32), condition_codes)
+        if seller_id:
+            mask &= np.frombuffer(self.seller_id.codes, dtype=np.uint32) == seller_code
+        rows = np.flatnonzero(mask)
+        if search:
+            term = search.lower()
+            return [row for row in rows.tolist() if term in self.search_text[row]]
+        return rows.tolist()
+
+    def _select_python(self, search, condition_codes, seller_id, seller_code, min_price, max_price) -> List[int]:
+        rows: Sequence[int] = range(len(self))
+        price = self.numeric["price"]
+        if min_price is not None or max_price is not None:
+            low = -math.inf if min_price is None else min_price
+            high = math.inf if max_price is None else max_price
+            rows = [row for row in rows if low <= price[row] <= high]
+        if condition_codes is not None:
+            codes, allowed = self.condition.codes, set(condition_codes)
+            rows = [row for row in rows if codes[row] in allowed]
+        if seller_id:
+            codes = self.seller_id.codes
+            rows = [row for row in rows if codes[row] == seller_code]
+        if search:
+            term = search.lower()
+            rows = [row for row in rows if term in self.search_text[row]]
+        return list(rows)
+
+    def sort(self, rows: List[int], sort_by: str, descending: bool = False) -> List[int]:
+        """
+        Ordena filas por una columna numérica de forma estable
+        Los valores faltantes (NaN) quedan siempre al final
+        """
+        column = self.numeric[sort_by]
+        if np is not None:
+            indices = np.asarray(rows, dtype=np.int64)
+            values = np.frombuffer(column, dtype=np.float64 if column.typecode == "d" else np.int64)[indices]
+            # Se ordena por -valor para descendente y así conservar la estabilidad
+            keys = -values.astype(np.float64) if descending else values.astype(np.float64)
+            return indices[np.argsort(keys, kind="stable")].tolist()
+
+        if column.typecode == "q":
+            # Las columnas enteras no tienen faltantes; sorted con reverse=True también es estable
+            return sorted(rows, key=column.__getitem__, reverse=descending)
+
+        def key(row: int):
+            value = column[row]
+            missing = value != value  # NaN
+            return (missing, 0 if missing else (-value if descending else value))
+
+        return sorted(rows, key=key)
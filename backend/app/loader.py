@@ -0,0 +1,333 @@
+# app/loader.py
+"""
+Carga incremental del catálogo con validación en la ingesta
+
+Los productos se leen uno a uno desde un arreglo JSON (products.json) o desde
+NDJSON, sin decodificar el documento completo. Cada producto se valida una sola
+vez contra el modelo Product y se guarda como JSON compacto en bytes, junto con
+sus campos más consultados en columnas (ver app/columns.py). Los registros
+inválidos se ponen en cuarentena con su línea y posición en el archivo.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from .columns import CatalogColumns
+from .models import Product, QuarantinedProduct
+
+logger = logging.getLogger(__name__)
+
+# Caracteres leídos del archivo en cada lectura
+READ_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+def is_ndjson(path: str) -> bool:
+    """Indica si el archivo usa formato NDJSON (un producto JSON por línea)"""
+    return path.endswith((".ndjson", ".jsonl"))
+
+
+def compact_json(value: Any) -> bytes:
+    """
+    Serializa un valor como JSON compacto en UTF-8 (sin espacios ni escapes ASCII)
+    Lanza: ValueError si contiene NaN o infinito, que no son JSON válido
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class JsonStreamReader:
+    """
+    Lector incremental de un documento JSON con forma {"products": [...], ...} o [...]
+
+    Mantiene en memoria solo un bloque del archivo más el elemento que se está
+    decodificando. Los valores de las demás claves de primer nivel (por ejemplo
+    payment_methods) se decodifican completos y quedan en `extras`.
+    """
+
+    def __init__(self, file, array_key: str = "products", chunk_size: int = READ_CHUNK_SIZE):
+        self.file = file
+        self.array_key = array_key
+        self.chunk_size = chunk_size
+        self.extras: Dict[str, Any] = {}
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.discarded = 0  # Caracteres ya descartados del inicio del buffer
+        self.line = 1  # Línea correspondiente a line_pos
+        self.line_pos = 0  # Posición en el buffer hasta donde se contaron saltos de línea
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Descarta lo ya procesado y lee otro bloque; retorna False al llegar al final"""
+        if self.eof:
+            return False
+        self._location()
+        self.discarded += self.pos
+        self.buffer = self.buffer[self.pos:]
+        self.line_pos -= self.pos
+        self.pos = 0
+
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def _location(self) -> Tuple[int, int]:
+        """Retorna (línea, posición en caracteres) de la posición actual en el archivo"""
+        self.line += self.buffer.count("\n", self.line_pos, self.pos)
+        self.line_pos = self.pos
+        return self.line, self.discarded + self.pos
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Crea un error de decodificación con la línea y posición reales en el archivo"""
+        line, offset = self._location()
+        error = json.JSONDecodeError(message, self.buffer, self.pos)
+        error.args = (f"{message}: línea {line}, posición {offset}",)
+        error.lineno, error.pos = line, offset
+        return error
+
+    def _peek(self) -> str:
+        """Salta espacios en blanco y retorna el siguiente carácter ("" al final del archivo)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                break
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise self._error(f"Se esperaba '{char}'")
+        self.pos += 1
+
+    def _decode_value(self) -> Any:
+        """Decodifica el siguiente valor JSON, leyendo más bloques si está incompleto"""
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # Un número al final del buffer podría continuar en el siguiente bloque
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise self._error("JSON inválido")
+            self._fill()
+
+    def _iter_array(self) -> Iterator[Tuple[Any, int, int]]:
+        """Recorre los elementos de un arreglo; la posición actual debe estar en '['"""
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            self._peek()
+            line, offset = self._location()
+            yield self._decode_value(), line, offset
+            separator = self._peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise self._error("Se esperaba ',' o ']'")
+
+    def __iter__(self) -> Iterator[Tuple[Any, int, int]]:
+        """
+        Recorre los elementos del arreglo de productos, ya sea en la clave
+        `array_key` del objeto principal o como arreglo de primer nivel ([...])
+        Retorna: tuplas (valor, línea, posición) por cada elemento
+        Lanza: json.JSONDecodeError si el documento no es JSON válido o si
+        `array_key` no contiene un arreglo
+        """
+        if self._peek() == "[":
+            yield from self._iter_array()
+            return
+
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise self._error("Se esperaba una clave de texto")
+            self._expect(":")
+
+            if key == self.array_key:
+                if self._peek() != "[":
+                    raise self._error(f"Se esperaba un arreglo en '{self.array_key}'")
+                yield from self._iter_array()
+            else:
+                self.extras[key] = self._decode_value()
+
+            separator = self._peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise self._error("Se esperaba ',' o '}'")
+
+
+def iter_raw_records(path: str, extras: Optional[dict] = None) -> Iterator[Tuple[Any, int, int]]:
+    """
+    Recorre los productos sin validar de un archivo products.json o NDJSON
+    Retorna: tuplas (valor, línea, posición); en NDJSON una línea con JSON inválido
+    produce una json.JSONDecodeError como valor en lugar de interrumpir la carga
+    Lanza: FileNotFoundError, o json.JSONDecodeError si un arreglo JSON está malformado
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        if is_ndjson(path):
+            offset = 0
+            for line_number, line in enumerate(file, start=1):
+                if line.strip():
+                    try:
+                        yield json.loads(line), line_number, offset
+                    except json.JSONDecodeError as exc:
+                        yield exc, line_number, offset
+                offset += len(line)
+        else:
+            reader = JsonStreamReader(file)
+            yield from reader
+            if extras is not None:
+                extras.update(reader.extras)
+
+
+def validate_record(raw: Any, line: int, offset: int) -> Tuple[Optional[dict], Optional[QuarantinedProduct]]:
+    """
+    Valida un producto contra el modelo Product
+    Retorna: (producto normalizado, None) si es válido, o (None, registro en cuarentena)
+    El producto retornado es el volcado del modelo, por lo que los valores convertidos
+    por Pydantic (ej: "price": "1500000") quedan con su tipo correcto
+    """
+    if isinstance(raw, json.JSONDecodeError):
+        errors = [f"JSON inválido: {raw.msg}"]
+    else:
+        try:
+            return Product.model_validate(raw).model_dump(mode="json"), None
+        except ValidationError as exc:
+            errors = [
+                f"{'.'.join(str(part) for part in error['loc']) or 'producto'}: {error['msg']}"
+                for error in exc.errors()
+            ]
+
+    product_id = raw.get("id") if isinstance(raw, dict) else None
+    return None, QuarantinedProduct(
+        product_id=None if product_id is None else str(product_id),
+        line=line,
+        offset=offset,
+        errors=errors,
+    )
+
+
+def quarantine_record(quarantine: Optional[List[QuarantinedProduct]], rejected: QuarantinedProduct):
+    """Registra un producto rechazado en el log y en la lista de cuarentena"""
+    logger.warning(
+        f"Producto en cuarentena (línea {rejected.line}, posición {rejected.offset}): "
+        f"{'; '.join(rejected.errors)}"
+    )
+    if quarantine is not None:
+        quarantine.append(rejected)
+
+
+def iter_products(
+    path: str,
+    quarantine: Optional[List[QuarantinedProduct]] = None,
+    extras: Optional[dict] = None,
+) -> Iterator[dict]:
+    """
+    Recorre los productos válidos de un archivo products.json o NDJSON
+    Los registros inválidos se agregan a `quarantine` (si se proporciona) y se omiten
+    """
+    for raw, line, offset in iter_raw_records(path, extras):
+        product, rejected = validate_record(raw, line, offset)
+        if rejected is not None:
+            quarantine_record(quarantine, rejected)
+            continue
+        yield product
+
+
+class CatalogSnapshot:
+    """
+    Resultado de cargar un archivo de catálogo: registros compactos, columnas,
+    índice por ID, medios de pago y productos en cuarentena
+
+    No se modifica después de la carga; una recarga crea otra instancia. Las filas
+    obtenidas con select() deben leerse con products_at() de la misma instancia.
+    """
+
+    def __init__(self):
+        self.records: List[bytes] = []  # Un producto por elemento, como JSON compacto
+        self.columns = CatalogColumns()  # Campos consultados, alineados por fila con records
+        self.index: Dict[int, int] = {}  # ID de producto -> posición en records
+        self.payment_methods: dict = {}
+        self.quarantine: List[QuarantinedProduct] = []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, product_id: int) -> Optional[dict]:
+        """Retorna el producto con el ID indicado, o None si no existe"""
+        position = self.index.get(product_id)
+        if position is None:
+            return None
+        return json.loads(self.records[position])
+
+    def select(self, **filters) -> List[int]:
+        """Filtra y ordena las filas sobre las columnas (ver CatalogColumns.select)"""
+        return self.columns.select(**filters)
+
+    def products_at(self, rows: Iterable[int]) -> Iterator[dict]:
+        """Recorre los productos de las filas indicadas, decodificando uno a la vez"""
+        for row in rows:
+            yield json.loads(self.records[row])
+
+    def products_by_ids(self, product_ids: Iterable[int]) -> Iterator[dict]:
+        """Recorre los productos con los IDs indicados, omitiendo los inexistentes"""
+        for product_id in product_ids:
+            product = self.get(product_id)
+            if product is not None:
+                yield product
+
+
+def rejected_product(product: dict, line: int, offset: int, error: str) -> QuarantinedProduct:
+    """Registro de cuarentena para un producto que pasó la validación del modelo"""
+    return QuarantinedProduct(product_id=str(product["id"]), line=line, offset=offset, errors=[error])
+
+
+def load_catalog_file(path: str) -> CatalogSnapshot:
+    """
+    Carga un catálogo de forma incremental, validando cada producto una sola vez
+    Lanza: FileNotFoundError, o json.JSONDecodeError si un arreglo JSON está malformado
+    """
+    loaded = CatalogSnapshot()
+    extras: dict = {}
+    for raw, line, offset in iter_raw_records(path, extras):
+        product, rejected = validate_record(raw, line, offset)
+        if product is not None and product["id"] in loaded.index:
+            product, rejected = None, rejected_product(product, line, offset, f"id: ID duplicado {product['id']}")
+        if product is not None:
+            # Campos libres como shipping no tienen tipo en el modelo y pueden traer NaN
+            try:
+                record = compact_json(product)
+            except ValueError as exc:
+                product, rejected = None, rejected_product(product, line, offset, f"JSON inválido: {exc}")
+        if product is not None:
+            try:
+                loaded.columns.append(product)
+            except (TypeError, ValueError, OverflowError) as exc:
+                product, rejected = None, rejected_product(product, line, offset, f"columnas: {exc}")
+        if rejected is not None:
+            quarantine_record(loaded.quarantine, rejected)
+            continue
+
+        loaded.index[product["id"]] = len(loaded.records)
+        loaded.records.append(record)
+
+    loaded.payment_methods = extras.get("payment_methods", {})
+    return loaded
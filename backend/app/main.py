@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from app.routers import products
+from app.routers import catalog, products, sellers
 from app.models import ErrorResponse
 import logging
 from datetime import datetime
@@ -38,6 +38,8 @@ app.add_middleware(
 
 # Incluir routers
 app.include_router(products.router, prefix="/api/v1", tags=["products"])
+app.include_router(sellers.router, prefix="/api/v1", tags=["sellers"])
+app.include_router(catalog.router, prefix="/api/v1", tags=["catalog"])
 
 @app.get("/")
 async def root():
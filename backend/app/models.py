@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class ErrorResponse(BaseModel):
@@ -46,6 +46,9 @@ class ProductCategory(BaseModel):
     series: str
 
 class Product(BaseModel):
+    # "inf" o "nan" no son números válidos para precios ni calificaciones
+    model_config = ConfigDict(allow_inf_nan=False)
+
     id: int
     title: str
     category: Optional[ProductCategory] = None
@@ -79,6 +82,35 @@ class ProductSummary(BaseModel):
     reviews_count: int
     seller_name: str
 
+class SellerSummary(BaseModel):
+    """Agregados de un vendedor calculados sobre el catálogo"""
+    id: str
+    name: str
+    reputation: str
+    location: str
+    is_mercado_lider: bool = False
+    products_count: int
+    sold_quantity: int
+    gmv: float  # Aproximación: suma de price × sold_quantity
+    average_rating: float
+    rating_distribution: Dict[str, int]  # Productos por estrellas completas ("4" = 4.0 a 4.9)
+    category_mix: Dict[str, int]  # Productos por subcategoría
+
+class QuarantinedProduct(BaseModel):
+    """Producto rechazado al cargar el catálogo, con su ubicación en el archivo"""
+    product_id: Optional[str] = None
+    line: int
+    offset: int  # Posición (en caracteres) desde el inicio del archivo
+    errors: List[str]
+
+class CatalogStatus(BaseModel):
+    """Estado de la última carga del catálogo"""
+    source: str
+    products_count: int
+    quarantined_count: int
+    quarantined: List[QuarantinedProduct]
+    loaded_at: Optional[datetime] = None
+
 class ErrorResponse(BaseModel):
     detail: str
     status_code: int
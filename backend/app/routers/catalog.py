@@ -0,0 +1,37 @@
+import os
+from fastapi import APIRouter, Query
+from ..models import CatalogStatus
+from .products import load_catalog
+
+# Router para consultar el estado de carga del catálogo
+router = APIRouter()
+
+@router.get("/catalog/status", response_model=CatalogStatus)
+async def get_catalog_status(
+    limit: int = Query(default=20, le=100),  # ?limit=20 - máximo 100 productos en cuarentena por página
+    offset: int = Query(default=0, ge=0)     # ?offset=0 - desplazamiento para paginación
+):
+    """
+    Endpoint para consultar el resultado de la última carga del catálogo
+    Incluye los productos rechazados en la validación, con su línea y posición en el archivo
+
+    Args:
+        limit: Número máximo de productos en cuarentena a retornar (default: 20, max: 100)
+        offset: Número de productos en cuarentena a saltar para paginación (default: 0)
+
+    Returns:
+        CatalogStatus: Cantidad de productos cargados y página de productos en cuarentena
+        (quarantined_count siempre es el total)
+
+    Raises:
+        HTTPException 500: Si el catálogo no se pudo cargar
+    """
+    catalog = load_catalog()
+    quarantine = catalog.quarantine
+    return CatalogStatus(
+        source=os.path.basename(catalog.path),  # Sin la ruta del servidor
+        products_count=len(catalog),
+        quarantined_count=len(quarantine),
+        quarantined=quarantine[offset:offset + limit],
+        loaded_at=catalog.loaded_at,
+    )
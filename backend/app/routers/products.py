@@ -1,29 +1,28 @@
 # Importaciones necesarias para FastAPI
 from fastapi import APIRouter, HTTPException, Query  # APIRouter para organizar rutas, HTTPException para errores HTTP, Query para parámetros de consulta
-from typing import List, Optional  # Para type hints - List para listas tipadas, Optional para valores opcionales
+from fastapi.responses import StreamingResponse  # Para enviar respuestas grandes por partes (streaming)
+from typing import Iterable, Iterator, List, Optional  # Para type hints - List para listas tipadas, Optional para valores opcionales
+import csv  # Para escribir filas en formato CSV
+import io  # Buffer en memoria para el escritor CSV
 import json  # Para leer y parsear archivos JSON
-import os  # Para operaciones del sistema de archivos
+import zlib  # Para comprimir con gzip al vuelo
 from datetime import datetime  # Para manejo de fechas (aunque no se usa actualmente)
 from ..models import Product, ProductSummary, ErrorResponse  # Importar modelos Pydantic desde módulo padre
+from ..catalog import Catalog, get_catalog  # Catálogo en memoria con recarga automática
+from ..loader import CatalogSnapshot  # Instantánea inmutable de una carga del catálogo
+from ..columns import SORTABLE_COLUMNS  # Columnas numéricas por las que se puede ordenar
 
 # Crear instancia del router para agrupar endpoints relacionados
 router = APIRouter()
 
-def load_products_data():
+def load_catalog() -> Catalog:
     """
-    Función utilitaria para cargar datos de productos desde archivo JSON
-    Retorna: dict con los datos de productos
+    Función utilitaria para obtener el catálogo en memoria (se recarga si el archivo cambió)
+    Retorna: Catalog con productos, medios de pago y agregados de vendedores
     Lanza: HTTPException si hay errores de archivo o JSON
     """
     try:
-        # Obtener directorio actual del archivo
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Construir ruta relativa al archivo de datos
-        data_path = os.path.join(current_dir, "..", "data", "products.json")
-        
-        # Abrir y leer archivo JSON con codificación UTF-8
-        with open(data_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        return get_catalog()
     except FileNotFoundError:
         # Lanzar excepción HTTP 500 si el archivo no existe
         raise HTTPException(
@@ -37,6 +36,206 @@ def load_products_data():
             detail="Error al decodificar datos de productos"
         )
 
+def find_product(snapshot: CatalogSnapshot, product_id: str) -> Optional[dict]:
+    """
+    Busca un producto por el ID recibido en la URL
+    Retorna: el producto, o None si el ID no es numérico o no existe
+    """
+    try:
+        return snapshot.get(int(product_id))
+    except ValueError:
+        # Los IDs se validan como enteros al cargar el catálogo
+        return None
+
+def build_product_summary(product: dict) -> ProductSummary:
+    """
+    Convierte un producto completo a ProductSummary (datos resumidos)
+    """
+    # Crear instancia de ProductSummary con validación automática de Pydantic
+    return ProductSummary(
+        id=product["id"],
+        title=product["title"],
+        price=product["price"],
+        currency=product["currency"],
+        condition=product["condition"],
+        # Usar primera imagen como thumbnail, cadena vacía si no hay imágenes
+        thumbnail=product["images"][0]["url"] if product["images"] else "",
+        rating=product["rating"],
+        reviews_count=product["reviews_count"],
+        seller_name=product["seller"]["name"]  # Extraer nombre del vendedor del objeto anidado
+    )
+
+# Tamaño aproximado (en bytes) de cada bloque enviado en la exportación
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Campos exportados por defecto en CSV (columnas planas, los anidados usan notación con punto)
+DEFAULT_CSV_FIELDS = [
+    "id", "title", "price", "original_price", "discount_percentage", "currency",
+    "condition", "available_quantity", "sold_quantity", "rating", "reviews_count",
+    "seller.id", "seller.name", "category.main", "category.sub", "category.brand",
+]
+
+# Tipos de contenido según el formato de exportación
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+def parse_export_fields(fields: Optional[str], export_format: str) -> Optional[List[str]]:
+    """
+    Convierte el parámetro ?fields=id,title,seller.name en una lista de campos
+    Retorna: lista de campos, o None para exportar el producto completo (solo NDJSON)
+    Lanza: HTTPException 400 si algún campo no existe en el modelo Product
+    """
+    if not fields:
+        # CSV necesita columnas fijas; NDJSON exporta el producto completo
+        return DEFAULT_CSV_FIELDS if export_format == "csv" else None
+
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    # Solo se valida el primer nivel del campo (ej: "seller" en "seller.name")
+    invalid = [field for field in selected if field.split(".")[0] not in Product.model_fields]
+    if invalid or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campos de exportación no válidos: {', '.join(invalid) or fields}"
+        )
+    return selected
+
+def get_field_value(product: dict, field: str):
+    """
+    Obtiene el valor de un campo de un producto, soportando notación con punto
+    Retorna: el valor encontrado o None si alguna parte del camino no existe
+    """
+    value = product
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def iter_ndjson_lines(products: Iterable[dict], fields: Optional[List[str]]) -> Iterator[str]:
+    """
+    Genera una línea JSON por producto (formato NDJSON)
+    """
+    for product in products:
+        if fields is not None:
+            product = {field: get_field_value(product, field) for field in fields}
+        yield json.dumps(product, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+def iter_csv_lines(products: Iterable[dict], fields: List[str]) -> Iterator[str]:
+    """
+    Genera la cabecera y una fila CSV por producto
+    Los valores anidados (listas u objetos) se serializan como JSON dentro de la celda
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for product in products:
+        row = []
+        for field in fields:
+            value = get_field_value(product, field)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            row.append("" if value is None else value)
+        writer.writerow(row)
+        # Entregar la fila escrita y reiniciar el buffer para no acumular memoria
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    # La cabecera queda en el buffer si no hubo productos
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def iter_export_chunks(lines: Iterable[str], compress: bool) -> Iterator[bytes]:
+    """
+    Agrupa las líneas en bloques de ~EXPORT_CHUNK_SIZE bytes, comprimiendo con gzip si se solicita
+    La memoria usada se mantiene acotada sin importar el tamaño del catálogo
+    """
+    # wbits=16+MAX_WBITS produce un flujo con cabecera y cola gzip
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+    pending: List[bytes] = []
+    pending_size = 0
+
+    for line in lines:
+        encoded = line.encode("utf-8")
+        pending.append(encoded)
+        pending_size += len(encoded)
+        if pending_size >= EXPORT_CHUNK_SIZE:
+            chunk = b"".join(pending)
+            pending, pending_size = [], 0
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+    chunk = b"".join(pending)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+# Ruta declarada antes de /products/{product_id} para que "export" no se tome como un ID
+@router.get("/products/export")
+async def export_products(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),  # ?format=ndjson|csv
+    fields: Optional[str] = Query(default=None),  # ?fields=id,title,seller.name - campos a exportar
+    search: Optional[str] = Query(default=None),  # ?search=samsung - búsqueda en título y descripción
+    condition: Optional[str] = Query(default=None),  # ?condition=Nuevo
+    seller_id: Optional[str] = Query(default=None),  # ?seller_id=samsung_official
+    min_price: Optional[float] = Query(default=None, ge=0),  # ?min_price=1000000
+    max_price: Optional[float] = Query(default=None, ge=0),  # ?max_price=3000000
+    compression: Optional[str] = Query(default=None, pattern="^gzip$"),  # ?compression=gzip
+):
+    """
+    Endpoint para exportar el catálogo completo en NDJSON o CSV, sin límite de paginación
+    La respuesta se genera en streaming por bloques de tamaño acotado
+    
+    Args:
+        format: Formato de salida, "ndjson" (default) o "csv"
+        fields: Lista de campos separados por coma; soporta campos anidados con punto
+        search: Término de búsqueda opcional en título y descripción
+        condition: Filtra por condición del producto
+        seller_id: Filtra por ID del vendedor
+        min_price: Precio mínimo
+        max_price: Precio máximo
+        compression: "gzip" para comprimir la respuesta al vuelo
+        
+    Returns:
+        StreamingResponse: Catálogo exportado en el formato solicitado
+        
+    Raises:
+        HTTPException 400: Si algún campo solicitado no existe
+        HTTPException 500: Error interno del servidor
+    """
+    # Validar campos y cargar datos antes de iniciar el streaming,
+    # ya que después de enviar cabeceras no es posible responder con un error
+    selected_fields = parse_export_fields(fields, format)
+    # Se toma una sola instantánea: las filas y los registros deben ser de la misma carga,
+    # aunque el catálogo se recargue mientras la respuesta se envía
+    snapshot = load_catalog().snapshot
+
+    # Los filtros se evalúan sobre las columnas; los productos se decodifican a medida que se envían
+    rows = snapshot.select(
+        search=search, condition=condition, seller_id=seller_id,
+        min_price=min_price, max_price=max_price
+    )
+    products = snapshot.products_at(rows)
+    if format == "csv":
+        lines = iter_csv_lines(products, selected_fields)
+    else:
+        lines = iter_ndjson_lines(products, selected_fields)
+
+    compress = compression == "gzip"
+    headers = {"Content-Disposition": f'attachment; filename="products.{format}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        iter_export_chunks(lines, compress),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
+
 # Decorador @router.get define un endpoint GET
 # response_model especifica el tipo de respuesta que FastAPI usará para validación y documentación
 @router.get("/products", response_model=List[ProductSummary])
@@ -44,15 +243,26 @@ async def get_products(
     # Query() define parámetros de consulta URL con validaciones
     limit: int = Query(default=20, le=100),  # ?limit=20 - máximo 100 elementos por página
     offset: int = Query(default=0, ge=0),    # ?offset=0 - desplazamiento para paginación, mínimo 0
-    search: Optional[str] = Query(default=None)  # ?search=samsung - búsqueda opcional
+    search: Optional[str] = Query(default=None),  # ?search=samsung - búsqueda opcional
+    condition: Optional[str] = Query(default=None),  # ?condition=Nuevo
+    min_price: Optional[float] = Query(default=None, ge=0),  # ?min_price=1000000
+    max_price: Optional[float] = Query(default=None, ge=0),  # ?max_price=3000000
+    # ?sort_by=price - ordenar por una columna numérica (por defecto, orden del catálogo)
+    sort_by: Optional[str] = Query(default=None, pattern=f"^({'|'.join(SORTABLE_COLUMNS)})$"),
+    order: str = Query(default="asc", pattern="^(asc|desc)$")  # ?order=desc - dirección del orden
 ):
     """
-    Endpoint para obtener lista de productos con paginación y búsqueda opcional
+    Endpoint para obtener lista de productos con paginación, búsqueda, filtros y orden opcionales
     
     Args:
         limit: Número máximo de productos a retornar (default: 20, max: 100)
         offset: Número de productos a saltar para paginación (default: 0)
         search: Término de búsqueda opcional para filtrar productos
+        condition: Filtra por condición del producto
+        min_price: Precio mínimo
+        max_price: Precio máximo
+        sort_by: Campo de orden: price, rating, sold_quantity, reviews_count o discount_percentage
+        order: "asc" (default) o "desc"
         
     Returns:
         List[ProductSummary]: Lista de productos resumidos
@@ -61,41 +271,21 @@ async def get_products(
         HTTPException 500: Error interno del servidor
     """
     try:
-        # Cargar datos desde el archivo JSON
-        data = load_products_data()
-        products = data["products"]
+        # Obtener la instantánea del catálogo (los productos se decodifican bajo demanda)
+        snapshot = load_catalog().snapshot
         
-        # Aplicar filtro de búsqueda si se proporciona
-        if search:
-            # List comprehension para filtrar productos
-            # Busca el término en título y descripción (case-insensitive)
-            products = [
-                p for p in products 
-                if search.lower() in p["title"].lower() or 
-                   search.lower() in p["description"].lower()
-            ]
+        # Filtrar y ordenar sobre las columnas del catálogo
+        # La búsqueda compara el término con título y descripción (case-insensitive)
+        rows = snapshot.select(
+            search=search, condition=condition, min_price=min_price, max_price=max_price,
+            sort_by=sort_by, descending=order == "desc"
+        )
         
-        # Aplicar paginación usando slicing de Python
-        # offset:offset+limit obtiene la "página" correspondiente
-        paginated_products = products[offset:offset + limit]
+        # Aplicar paginación usando slicing: solo se decodifican los productos de la "página"
+        paginated_products = snapshot.products_at(rows[offset:offset + limit])
         
         # Convertir productos completos a ProductSummary (datos resumidos)
-        summaries = []
-        for product in paginated_products:
-            # Crear instancia de ProductSummary con validación automática de Pydantic
-            summary = ProductSummary(
-                id=product["id"],
-                title=product["title"],
-                price=product["price"],
-                currency=product["currency"],
-                condition=product["condition"],
-                # Usar primera imagen como thumbnail, cadena vacía si no hay imágenes
-                thumbnail=product["images"][0]["url"] if product["images"] else "",
-                rating=product["rating"],
-                reviews_count=product["reviews_count"],
-                seller_name=product["seller"]["name"]  # Extraer nombre del vendedor del objeto anidado
-            )
-            summaries.append(summary)
+        summaries = [build_product_summary(product) for product in paginated_products]
         
         # FastAPI automáticamente serializa la lista a JSON
         return summaries
@@ -125,27 +315,8 @@ async def get_product(product_id: str):  # Path parameter viene como string auto
         HTTPException 500: Error interno del servidor
     """
     try:
-        # Cargar datos de productos
-        data = load_products_data()
-        products = data["products"]
-        
-        # Buscar producto por ID (soporta tanto string como int)
-        product_data = None
-        
-        # Intentar convertir a int si es posible, sino usar como string
-        try:
-            product_id_int = int(product_id)
-            # Buscar por ID numérico
-            for product in products:
-                if product["id"] == product_id_int:
-                    product_data = product
-                    break
-        except ValueError:
-            # Si no es número, buscar por ID string
-            for product in products:
-                if str(product.get("id")) == product_id:
-                    product_data = product
-                    break
+        # Buscar producto por ID usando el índice del catálogo
+        product_data = find_product(load_catalog().snapshot, product_id)
         
         # Verificar si se encontró el producto
         if not product_data:
@@ -155,9 +326,8 @@ async def get_product(product_id: str):  # Path parameter viene como string auto
                 detail=f"Producto con ID {product_id} no encontrado"
             )
         
-        # Crear instancia de Product usando desempaquetado de diccionario (**)
-        # Pydantic validará automáticamente todos los campos
-        return Product(**product_data)
+        # El producto ya fue validado contra el modelo Product al cargar el catálogo
+        return product_data
         
     except HTTPException:
         # Re-lanzar HTTPExceptions sin modificar (para mantener código de estado)
@@ -192,27 +362,9 @@ async def get_related_products(
         HTTPException 500: Error interno del servidor
     """
     try:
-        # Cargar datos de productos
-        data = load_products_data()
-        products = data["products"]
-        
-        # Buscar el producto base (soporta tanto string como int)
-        current_product = None
-        
-        # Intentar convertir a int si es posible, sino usar como string
-        try:
-            product_id_int = int(product_id)
-            # Buscar por ID numérico
-            for product in products:
-                if product["id"] == product_id_int:
-                    current_product = product
-                    break
-        except ValueError:
-            # Si no es número, buscar por ID string
-            for product in products:
-                if str(product.get("id")) == product_id:
-                    current_product = product
-                    break
+        # Buscar el producto base usando el índice del catálogo
+        snapshot = load_catalog().snapshot
+        current_product = find_product(snapshot, product_id)
         
         # Verificar que el producto base existe
         if not current_product:
@@ -223,41 +375,22 @@ async def get_related_products(
         
         # Filtrar productos relacionados excluyendo el actual
         # Priorizar productos del mismo vendedor, luego otros productos
-        current_product_id = current_product["id"]
+        current_row = snapshot.index[current_product["id"]]
         current_seller_name = current_product["seller"]["name"]
         
-        # Separar productos por vendedor
-        same_seller_products = []
-        other_products = []
-        
-        for p in products:
-            if p["id"] != current_product_id:
-                if p["seller"]["name"] == current_seller_name:
-                    same_seller_products.append(p)
-                else:
-                    other_products.append(p)
+        # Separar filas por vendedor usando la columna codificada de nombres de vendedor
+        columns = snapshot.columns
+        same_seller_rows = columns.rows_with(columns.seller_name, current_seller_name)
+        other_rows = columns.rows_with(columns.seller_name, current_seller_name, equal=False)
         
-        # Combinar: primero productos del mismo vendedor, luego otros
-        related_products = same_seller_products + other_products
+        # Combinar: primero productos del mismo vendedor, luego otros, excluyendo el actual
+        related_rows = [row for row in same_seller_rows + other_rows if row != current_row]
         
-        # Aplicar límite usando slicing
-        related_products = related_products[:limit]
+        # Aplicar límite usando slicing antes de decodificar los productos
+        related_products = snapshot.products_at(related_rows[:limit])
         
         # Convertir a ProductSummary (misma lógica que en get_products)
-        summaries = []
-        for product in related_products:
-            summary = ProductSummary(
-                id=product["id"],
-                title=product["title"],
-                price=product["price"],
-                currency=product["currency"],
-                condition=product["condition"],
-                thumbnail=product["images"][0]["url"] if product["images"] else "",
-                rating=product["rating"],
-                reviews_count=product["reviews_count"],
-                seller_name=product["seller"]["name"]
-            )
-            summaries.append(summary)
+        summaries = [build_product_summary(product) for product in related_products]
         
         return summaries
         
@@ -283,12 +416,12 @@ async def get_payment_methods():
         HTTPException 500: Error interno del servidor
     """
     try:
-        # Cargar datos de productos que incluye payment_methods
-        data = load_products_data()
+        # Obtener los medios de pago cargados junto con el catálogo
+        catalog = load_catalog()
         
         # Retornar solo la sección de payment_methods
-        if "payment_methods" in data:
-            return data["payment_methods"]
+        if catalog.payment_methods:
+            return catalog.payment_methods
         else:
             # Fallback si no existe la sección
             return {
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List
+from ..models import ProductSummary, SellerSummary
+from .products import build_product_summary, load_catalog
+
+# Router para los endpoints de analítica de vendedores
+router = APIRouter()
+
+@router.get("/sellers", response_model=List[SellerSummary])
+async def get_sellers(
+    limit: int = Query(default=20, le=100),  # ?limit=20 - máximo 100 vendedores por página
+    offset: int = Query(default=0, ge=0),    # ?offset=0 - desplazamiento para paginación
+    # ?sort_by=gmv - criterio de orden (descendente, excepto "name")
+    sort_by: str = Query(default="gmv", pattern="^(gmv|products_count|sold_quantity|average_rating|name)$")
+):
+    """
+    Endpoint para obtener los agregados de vendedores (conteos, GMV, calificaciones, categorías)
+    Los agregados están precalculados y se actualizan al recargar el catálogo
+
+    Args:
+        limit: Número máximo de vendedores a retornar (default: 20, max: 100)
+        offset: Número de vendedores a saltar para paginación (default: 0)
+        sort_by: Métrica de orden: gmv, products_count, sold_quantity, average_rating o name
+
+    Returns:
+        List[SellerSummary]: Lista de vendedores con sus agregados
+
+    Raises:
+        HTTPException 500: Error interno del servidor
+    """
+    try:
+        catalog = load_catalog()
+        ranked = catalog.sellers.ranked(sort_by)[offset:offset + limit]
+        return [SellerSummary(**seller.to_dict()) for seller in ranked]
+
+    except HTTPException:
+        # Re-lanzar HTTPExceptions sin modificar (para mantener código de estado)
+        raise
+    except Exception as e:
+        # Capturar cualquier otra excepción y convertir a error 500
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error interno del servidor: {str(e)}"
+        )
+
+@router.get("/sellers/{seller_id}/products", response_model=List[ProductSummary])
+async def get_seller_products(
+    seller_id: str,  # Path parameter: ID del vendedor (ej: samsung_official)
+    limit: int = Query(default=20, le=100),
+    offset: int = Query(default=0, ge=0)
+):
+    """
+    Endpoint para obtener los productos de un vendedor
+
+    Args:
+        seller_id (str): ID del vendedor en la URL
+        limit: Número máximo de productos a retornar (default: 20, max: 100)
+        offset: Número de productos a saltar para paginación (default: 0)
+
+    Returns:
+        List[ProductSummary]: Productos del vendedor
+
+    Raises:
+        HTTPException 404: Si el vendedor no existe
+        HTTPException 500: Error interno del servidor
+    """
+    try:
+        catalog = load_catalog()
+        snapshot = catalog.snapshot
+        if catalog.sellers.get(seller_id) is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Vendedor con ID {seller_id} no encontrado"
+            )
+
+        # Las filas de la columna de vendedores siguen el orden del archivo,
+        # sin importar en qué recarga se agregó o modificó cada producto
+        rows = snapshot.columns.rows_with(snapshot.columns.seller_id, seller_id)
+        return [build_product_summary(product) for product in snapshot.products_at(rows[offset:offset + limit])]
+
+    except HTTPException:
+        # Preservar HTTPExceptions existentes (ej: 404)
+        raise
+    except Exception as e:
+        # Convertir errores inesperados a HTTP 500
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error interno del servidor: {str(e)}"
+        )
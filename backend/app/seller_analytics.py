@@ -0,0 +1,177 @@
+# app/seller_analytics.py
+"""
+Agregados de vendedores calculados en una sola pasada sobre el catálogo
+
+Los agregados se mantienen de forma incremental: agregar o quitar un producto
+solo actualiza los acumuladores de su vendedor, sin recorrer el catálogo completo.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+
+def rating_bucket(rating: float) -> str:
+    """
+    Agrupa una calificación en estrellas completas ("0" a "5")
+    Ej: 4.7 -> "4", 5.0 -> "5"
+    """
+    return str(min(int(rating), 5))
+
+
+def category_name(product: dict) -> str:
+    """
+    Retorna la subcategoría del producto, o "Sin categoría" si no tiene
+    """
+    category = product.get("category") or {}
+    return category.get("sub") or "Sin categoría"
+
+
+class SellerAggregate:
+    """
+    Acumuladores de un vendedor: conteos, GMV aproximado, calificaciones y mezcla de categorías
+    """
+
+    def __init__(self, seller: dict):
+        self.id = seller["id"]
+        self.update_info(seller)
+        self.product_ids: Dict[int, None] = {}  # dict como conjunto ordenado de IDs
+        self.sold_quantity = 0
+        self.gmv = 0.0  # Aproximación: suma de price × sold_quantity
+        self.rating_sum = 0.0
+        self.rating_distribution: Counter = Counter()
+        self.category_mix: Counter = Counter()
+
+    def update_info(self, seller: dict):
+        """Actualiza los datos descriptivos del vendedor con los del producto más reciente"""
+        self.name = seller["name"]
+        self.reputation = seller.get("reputation", "")
+        self.location = seller.get("location", "")
+        self.is_mercado_lider = seller.get("is_mercado_lider", False)
+
+    @property
+    def products_count(self) -> int:
+        return len(self.product_ids)
+
+    @property
+    def average_rating(self) -> float:
+        if not self.product_ids:
+            return 0.0
+        return round(self.rating_sum / len(self.product_ids), 2)
+
+    def add(self, product: dict):
+        """Suma la contribución de un producto a los acumuladores"""
+        self.update_info(product["seller"])
+        self.product_ids[product["id"]] = None
+        self.sold_quantity += product["sold_quantity"]
+        self.gmv += product["price"] * product["sold_quantity"]
+        self.rating_sum += product["rating"]
+        self.rating_distribution[rating_bucket(product["rating"])] += 1
+        self.category_mix[category_name(product)] += 1
+
+    def remove(self, product: dict):
+        """Resta la contribución de un producto previamente agregado"""
+        self.product_ids.pop(product["id"], None)
+        self.sold_quantity -= product["sold_quantity"]
+        self.gmv -= product["price"] * product["sold_quantity"]
+        self.rating_sum -= product["rating"]
+        self.rating_distribution[rating_bucket(product["rating"])] -= 1
+        self.category_mix[category_name(product)] -= 1
+        # Eliminar claves en cero para no exponer buckets vacíos
+        self.rating_distribution += Counter()
+        self.category_mix += Counter()
+
+    def merge(self, other: "SellerAggregate"):
+        """Suma los acumuladores de otro agregado (ej: otro ID con el mismo nombre)"""
+        self.product_ids.update(other.product_ids)
+        self.sold_quantity += other.sold_quantity
+        self.gmv += other.gmv
+        self.rating_sum += other.rating_sum
+        self.rating_distribution += other.rating_distribution
+        self.category_mix += other.category_mix
+
+    def to_dict(self) -> dict:
+        """Convierte el agregado a un diccionario compatible con el modelo SellerSummary"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "reputation": self.reputation,
+            "location": self.location,
+            "is_mercado_lider": self.is_mercado_lider,
+            "products_count": self.products_count,
+            "sold_quantity": self.sold_quantity,
+            "gmv": round(self.gmv, 2),
+            "average_rating": self.average_rating,
+            "rating_distribution": dict(sorted(self.rating_distribution.items())),
+            "category_mix": dict(self.category_mix.most_common()),
+        }
+
+
+class SellerAnalytics:
+    """
+    Índice de agregados por ID de vendedor, actualizable de forma incremental
+    """
+
+    def __init__(self, products: Optional[Iterable[dict]] = None):
+        self.sellers: Dict[str, SellerAggregate] = {}
+        if products is not None:
+            self.apply_changes(added=products)
+
+    def add_product(self, product: dict):
+        seller = product["seller"]
+        aggregate = self.sellers.get(seller["id"])
+        if aggregate is None:
+            aggregate = self.sellers[seller["id"]] = SellerAggregate(seller)
+        aggregate.add(product)
+
+    def remove_product(self, product: dict):
+        aggregate = self.sellers.get(product["seller"]["id"])
+        if aggregate is None:
+            return
+        aggregate.remove(product)
+        # Un vendedor sin productos deja de aparecer en los agregados
+        if not aggregate.product_ids:
+            del self.sellers[aggregate.id]
+
+    def apply_changes(self, added: Iterable[dict] = (), removed: Iterable[dict] = ()):
+        """
+        Aplica un conjunto de cambios del catálogo
+        Un producto modificado debe aparecer en removed (versión anterior) y en added (nueva)
+        """
+        for product in removed:
+            self.remove_product(product)
+        for product in added:
+            self.add_product(product)
+
+    def get(self, seller_id: str) -> Optional[SellerAggregate]:
+        return self.sellers.get(seller_id)
+
+    def ranked(self, sort_by: str = "gmv") -> List[SellerAggregate]:
+        """
+        Retorna los vendedores ordenados por el criterio indicado
+        "name" ordena ascendente; el resto de métricas ordenan descendente
+        """
+        if sort_by == "name":
+            return sorted(self.sellers.values(), key=lambda s: s.name.lower())
+        return sorted(self.sellers.values(), key=lambda s: getattr(s, sort_by), reverse=True)
+
+    def grouped_by_name(self) -> List[SellerAggregate]:
+        """
+        Retorna agregados combinados por nombre de vendedor, ordenados por nombre
+        Varios IDs pueden compartir nombre; los productos relacionados agrupan por nombre
+        El ID del agregado combinado lista los IDs originales separados por coma
+        """
+        groups: Dict[str, SellerAggregate] = {}
+        for seller in self.ranked("name"):
+            group = groups.get(seller.name)
+            if group is None:
+                group = groups[seller.name] = SellerAggregate({
+                    "id": seller.id,
+                    "name": seller.name,
+                    "reputation": seller.reputation,
+                    "location": seller.location,
+                    "is_mercado_lider": seller.is_mercado_lider,
+                })
+            else:
+                group.id = f"{group.id}, {seller.id}"
+            group.merge(seller)
+        return list(groups.values())
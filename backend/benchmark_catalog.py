@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria y tiempo de consulta del catálogo
+
+Genera un catálogo NDJSON sintético a partir de los productos de ejemplo y compara
+la representación columnar (registros compactos + columnas) con una lista de
+diccionarios anidados: memoria por producto y tiempo de filtrar y ordenar.
+
+Uso: python benchmark_catalog.py [cantidad]   (default: 100000)
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from app import columns
+from app.catalog import DEFAULT_DATA_PATH
+from app.loader import load_catalog_file
+
+SEARCH_TERM = "galaxy"
+MIN_PRICE, MAX_PRICE = 1000000, 5000000
+REPETITIONS = 5
+
+
+def write_synthetic_catalog(path, count):
+    """Escribe `count` productos variando ID, precio, calificación y ventas"""
+    with open(DEFAULT_DATA_PATH, "r", encoding="utf-8") as file:
+        samples = json.load(file)["products"]
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf-8") as file:
+        for product_id in range(1, count + 1):
+            product = dict(samples[product_id % len(samples)])
+            product["id"] = product_id
+            product["price"] = round(product["price"] * rng.uniform(0.5, 1.5))
+            product["rating"] = round(rng.uniform(3, 5), 1)
+            product["sold_quantity"] = rng.randint(0, 5000)
+            file.write(json.dumps(product, ensure_ascii=False) + "\n")
+
+
+def measure(load):
+    """Retorna (resultado, bytes retenidos, bytes pico, segundos) de una función de carga"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, elapsed
+
+
+def best_time(function):
+    """Mejor tiempo de REPETITIONS ejecuciones"""
+    times = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load_dicts(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def scan_dicts(products, search=None):
+    """Filtro por rango de precio (y búsqueda opcional) y orden por ventas, sobre diccionarios"""
+    matches = [
+        p for p in products
+        if MIN_PRICE <= p["price"] <= MAX_PRICE
+        and (not search or search in p["title"].lower() or search in p["description"].lower())
+    ]
+    return sorted(matches, key=lambda p: p["sold_quantity"], reverse=True)
+
+
+def scan_columns(loaded, search=None):
+    """La misma consulta sobre las columnas del catálogo"""
+    return loaded.columns.select(
+        search=search, min_price=MIN_PRICE, max_price=MAX_PRICE,
+        sort_by="sold_quantity", descending=True
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "products.ndjson")
+        write_synthetic_catalog(path, count)
+        file_size = os.path.getsize(path)
+
+        dicts, dict_bytes, dict_peak, dict_load = measure(lambda: load_dicts(path))
+        dict_scans = [best_time(lambda: scan_dicts(dicts, search)) for search in (None, SEARCH_TERM)]
+        expected = [[p["id"] for p in scan_dicts(dicts, search)] for search in (None, SEARCH_TERM)]
+        del dicts
+
+        loaded, columnar_bytes, columnar_peak, columnar_load = measure(lambda: load_catalog_file(path))
+        columnar_scans = [best_time(lambda: scan_columns(loaded, search)) for search in (None, SEARCH_TERM)]
+        results = [
+            [loaded.columns.ids[row] for row in scan_columns(loaded, search)]
+            for search in (None, SEARCH_TERM)
+        ]
+        records_bytes = sum(len(record) for record in loaded.records)
+
+    assert results == expected, "Las consultas columnares no coinciden con las de diccionarios"
+
+    print("BENCHMARK DEL CATÁLOGO")
+    print("=" * 60)
+    print(f"Productos: {count:,} | Archivo NDJSON: {file_size / 1e6:.1f} MB | "
+          f"NumPy: {'sí' if columns.np is not None else 'no'}")
+    print(f"Consulta A: precio {MIN_PRICE:,}-{MAX_PRICE:,}, orden por ventas ({len(results[0]):,} resultados)")
+    print(f"Consulta B: A + búsqueda '{SEARCH_TERM}' ({len(results[1]):,} resultados)")
+    print()
+    print(f"{'':24}{'Diccionarios':>16}{'Columnar':>16}")
+    print(f"{'Memoria por producto':24}{dict_bytes / count:>14,.0f} B{columnar_bytes / count:>14,.0f} B")
+    print(f"{'Pico de carga':24}{dict_peak / 1e6:>13,.1f} MB{columnar_peak / 1e6:>13,.1f} MB")
+    print(f"{'Tiempo de carga *':24}{dict_load:>14.2f} s{columnar_load:>14.2f} s")
+    for label, dict_scan, columnar_scan in zip(("A", "B"), dict_scans, columnar_scans):
+        print(f"{'Tiempo de consulta ' + label:24}{dict_scan * 1000:>13.1f} ms{columnar_scan * 1000:>13.1f} ms")
+    print()
+    print(f"Detalle columnar por producto: registros compactos {records_bytes / count:,.0f} B, "
+          f"columnas numéricas y códigos {loaded.columns.nbytes() / count:,.0f} B")
+    print("* Medido con tracemalloc activo; incluye validación y codificación en la carga columnar")
+
+
+if __name__ == "__main__":
+    main()
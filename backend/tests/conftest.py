@@ -0,0 +1,14 @@
+import json
+import pytest
+from app.catalog import DEFAULT_DATA_PATH
+
+@pytest.fixture
+def sample_data():
+    """Contenido completo del archivo de datos de ejemplo (se lee de nuevo en cada test)"""
+    with open(DEFAULT_DATA_PATH, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+@pytest.fixture
+def sample_products(sample_data):
+    """Productos del archivo de datos de ejemplo"""
+    return sample_data["products"]
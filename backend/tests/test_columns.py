@@ -0,0 +1,121 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app import columns as columns_module
+from app.columns import CatalogColumns
+
+client = TestClient(app)
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Ejecuta cada test con NumPy (si está instalado) y con Python puro"""
+    if request.param == "numpy" and columns_module.np is None:
+        pytest.skip("NumPy no está instalado")
+    if request.param == "python":
+        monkeypatch.setattr(columns_module, "np", None)
+    return request.param
+
+class TestCatalogColumns:
+
+    def build(self, products):
+        columns = CatalogColumns()
+        for product in products:
+            columns.append(product)
+        return columns
+
+    def test_select_matches_filtering_dicts(self, backend, sample_products):
+        """Test que los filtros sobre columnas coinciden con filtrar los diccionarios"""
+        products = sample_products
+        columns = self.build(products)
+        seller_id = products[0]["seller"]["id"]
+
+        rows = columns.select(search="galaxy", min_price=1000000, max_price=5000000)
+        expected = [
+            i for i, p in enumerate(products)
+            if ("galaxy" in p["title"].lower() or "galaxy" in p["description"].lower())
+            and 1000000 <= p["price"] <= 5000000
+        ]
+        assert rows == expected
+        assert columns.select(seller_id=seller_id, condition="nuevo") == \
+               [i for i, p in enumerate(products) if p["seller"]["id"] == seller_id]
+        assert columns.select(seller_id="nonexistent") == []
+
+    def test_sort_is_stable_and_handles_missing_values(self, backend, sample_products):
+        """Test orden estable, descendente y con valores faltantes al final"""
+        products = sample_products[:6]
+        products[2] = dict(products[2], discount_percentage=None)
+        columns = self.build(products)
+
+        rows = columns.select(sort_by="price", descending=True)
+        assert rows == sorted(range(len(products)), key=lambda i: -products[i]["price"])
+        # Productos 2 y 3 sin descuento: al final, conservando su orden original
+        rows = columns.select(sort_by="discount_percentage")
+        assert rows == [1, 5, 4, 0, 2, 3]
+
+    def test_append_failure_keeps_columns_aligned(self, backend, sample_products):
+        """Test que un valor fuera de rango no deja filas parciales"""
+        products = sample_products[:2]
+        columns = self.build(products[:1])
+        with pytest.raises(OverflowError):
+            columns.append(dict(products[1], reviews_count=10 ** 20))
+        assert {len(column) for column in columns._all_columns()} == {1}
+        columns.append(products[1])
+        assert columns.select(sort_by="price") == sorted([0, 1], key=lambda i: products[i]["price"])
+
+    def test_descending_sort_keeps_ties_in_original_order(self, backend, sample_products):
+        """Test estabilidad del orden descendente con valores repetidos (enteros y decimales)"""
+        products = [
+            dict(p, sold_quantity=quantity, price=float(quantity or 1))
+            for p, quantity in zip(sample_products, [5, 9, 5, 0, 9, 5])
+        ]
+        columns = self.build(products)
+        assert columns.sort(list(range(6)), "sold_quantity", descending=True) == [1, 4, 0, 2, 5, 3]
+        assert columns.sort(list(range(6)), "price", descending=True) == [1, 4, 0, 2, 5, 3]
+        assert columns.sort([5, 2, 0], "sold_quantity") == [5, 2, 0]
+
+    def test_rows_with(self, backend, sample_products):
+        """Test filas por valor de una columna de diccionario"""
+        products = sample_products
+        columns = self.build(products)
+        name = products[0]["seller"]["name"]
+        same = [i for i, p in enumerate(products) if p["seller"]["name"] == name]
+
+        assert columns.rows_with(columns.seller_name, name) == same
+        assert columns.rows_with(columns.seller_name, name, equal=False) == \
+               [i for i in range(len(products)) if i not in same]
+        assert columns.rows_with(columns.seller_name, "nonexistent") == []
+        assert columns.rows_with(columns.seller_name, "nonexistent", equal=False) == \
+               list(range(len(products)))
+
+    def test_dictionary_columns(self, backend, sample_products):
+        """Test codificación como diccionario de las columnas de texto"""
+        products = sample_products
+        columns = self.build(products)
+        assert columns.currency.values == ["COP"]
+        assert columns.seller_name[0] == products[0]["seller"]["name"]
+        assert len(columns.seller_id.values) < len(products)
+
+class TestProductsColumnsAPI:
+
+    def test_get_products_sorted_by_price(self):
+        """Test listado ordenado por precio descendente"""
+        response = client.get("/api/v1/products?sort_by=price&order=desc&limit=100")
+        assert response.status_code == 200
+        prices = [p["price"] for p in response.json()]
+        assert prices == sorted(prices, reverse=True)
+
+    def test_get_products_price_range(self):
+        """Test filtro por rango de precio"""
+        response = client.get("/api/v1/products?min_price=1000000&max_price=2000000&limit=100")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        assert all(1000000 <= p["price"] <= 2000000 for p in data)
+
+    def test_invalid_sort_parameter(self):
+        """Test campo de orden inválido"""
+        response = client.get("/api/v1/products?sort_by=title")
+        assert response.status_code == 422
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,216 @@
+import copy
+import io
+import json
+import os
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app import catalog as catalog_module
+from app.catalog import Catalog, DEFAULT_DATA_PATH
+from app.loader import JsonStreamReader, iter_products, load_catalog_file
+
+client = TestClient(app)
+
+class TestCatalogLoader:
+
+    @pytest.mark.parametrize("chunk_size", [7, 64, 4096])
+    def test_stream_reader_matches_json_load(self, chunk_size):
+        """Test que la lectura incremental produce los mismos datos que json.load"""
+        with open(DEFAULT_DATA_PATH, 'r', encoding='utf-8') as file:
+            text = file.read()
+        data = json.loads(text)
+
+        reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+        items = list(reader)
+        assert [value for value, _, _ in items] == data["products"]
+        assert reader.extras == {"payment_methods": data["payment_methods"]}
+
+        # La línea y posición apuntan al inicio de cada producto en el archivo
+        for _, line, offset in items:
+            assert text[offset] == "{"
+            assert text.count("\n", 0, offset) + 1 == line
+
+    def test_stream_reader_syntax_error_location(self):
+        """Test error de sintaxis con la línea real del archivo"""
+        text = '{\n  "products": [\n    {"id": 1},\n    {"id": 2,}\n  ]\n}'
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            list(JsonStreamReader(io.StringIO(text), chunk_size=5))
+        assert exc_info.value.lineno == 4
+
+    def test_stream_reader_top_level_array(self, sample_products):
+        """Test que un arreglo de productos en el primer nivel también se lee"""
+        products = sample_products[:3]
+        reader = JsonStreamReader(io.StringIO(json.dumps(products, indent=2)), chunk_size=16)
+        assert [value for value, _, _ in reader] == products
+        assert reader.extras == {}
+
+    @pytest.mark.parametrize("value", ["null", "{}", '"x"'])
+    def test_stream_reader_products_must_be_array(self, value):
+        """Test error cuando la clave products no contiene un arreglo"""
+        text = '{\n  "payment_methods": {},\n  "products": ' + value + '\n}'
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            list(JsonStreamReader(io.StringIO(text)))
+        assert exc_info.value.lineno == 3
+        assert "arreglo" in str(exc_info.value)
+
+    def test_invalid_products_are_quarantined(self, tmp_path, sample_data):
+        """Test que los productos inválidos quedan en cuarentena sin afectar al resto"""
+        data = sample_data
+        invalid = copy.deepcopy(data["products"][1])
+        invalid["price"] = -10
+        duplicated = copy.deepcopy(data["products"][0])
+        data["products"][1] = invalid
+        data["products"].append(duplicated)
+
+        data_path = tmp_path / "products.json"
+        data_path.write_text(json.dumps(data, indent=4, ensure_ascii=False), encoding="utf-8")
+        loaded = load_catalog_file(str(data_path))
+
+        assert len(loaded.records) == len(data["products"]) - 2
+        assert invalid["id"] not in loaded.index
+        assert loaded.payment_methods == data["payment_methods"]
+
+        rejected_price, rejected_duplicate = loaded.quarantine
+        assert rejected_price.product_id == str(invalid["id"])
+        assert any(error.startswith("price:") for error in rejected_price.errors)
+        assert rejected_duplicate.product_id == str(duplicated["id"])
+        text = data_path.read_text(encoding="utf-8")
+        assert text.count("\n", 0, rejected_price.offset) + 1 == rejected_price.line
+
+    def test_coercible_values_are_normalized(self, tmp_path, sample_data):
+        """Test que los valores convertibles se guardan con el tipo del modelo"""
+        data = sample_data
+        coerced = dict(data["products"][0], id="9002", price="1500000", sold_quantity=5.0)
+        data["products"].append(coerced)
+
+        data_path = tmp_path / "products.json"
+        data_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        catalog = Catalog(str(data_path))
+        assert catalog.refresh() is True
+        assert catalog.quarantine == []
+
+        product = catalog.get(9002)
+        assert product["price"] == 1500000
+        assert isinstance(product["price"], float)
+        assert product["sold_quantity"] == 5
+        seller = catalog.sellers.get(coerced["seller"]["id"])
+        assert 9002 in seller.product_ids
+
+    def test_values_that_do_not_fit_columns_are_quarantined(self, tmp_path, sample_products):
+        """Test que un producto válido pero fuera del rango de las columnas queda en cuarentena"""
+        products = sample_products[:3]
+        products[1] = dict(products[1], reviews_count=10 ** 20, sold_quantity=5.0)
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(json.dumps(p) for p in products), encoding="utf-8")
+
+        loaded = load_catalog_file(str(data_path))
+        assert list(loaded.index) == [products[0]["id"], products[2]["id"]]
+        assert list(loaded.columns.ids) == [products[0]["id"], products[2]["id"]]
+        assert len(loaded.columns) == len(loaded.records)
+        (rejected,) = loaded.quarantine
+        assert rejected.line == 2
+        assert rejected.errors[0].startswith("columnas:")
+
+    def test_non_finite_numbers_are_quarantined(self, tmp_path, monkeypatch, sample_products):
+        """Test que NaN e infinito quedan en cuarentena y no rompen la API ni el NDJSON"""
+        products = sample_products[:5]
+        lines = [
+            json.dumps(products[0]),
+            json.dumps(dict(products[1], price="inf")),
+            json.dumps(dict(products[2], price=float("inf"))),  # Literal Infinity
+            json.dumps(dict(products[3], original_price="nan")),
+            json.dumps(dict(products[4], shipping={"cost": float("nan")})),
+        ]
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(lines), encoding="utf-8")
+
+        loaded = load_catalog_file(str(data_path))
+        assert list(loaded.index) == [products[0]["id"]]
+        assert [q.line for q in loaded.quarantine] == [2, 3, 4, 5]
+        assert loaded.quarantine[0].errors[0].startswith("price:")
+        assert loaded.quarantine[2].errors[0].startswith("original_price:")
+        assert loaded.quarantine[3].errors[0].startswith("JSON inválido:")
+
+        monkeypatch.setattr(catalog_module, "_catalog", Catalog(str(data_path)))
+        assert client.get("/api/v1/products?sort_by=price").status_code == 200
+        response = client.get("/api/v1/products/export")
+        assert response.status_code == 200
+        assert [json.loads(line)["id"] for line in response.text.strip().split("\n")] == [products[0]["id"]]
+
+    def test_ndjson_bad_lines_are_quarantined(self, tmp_path, sample_products):
+        """Test NDJSON con líneas malformadas e inválidas"""
+        products = sample_products[:3]
+        lines = [json.dumps(products[0]), "{not json", json.dumps({"id": 5}), json.dumps(products[1])]
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(lines), encoding="utf-8")
+
+        quarantine = []
+        valid = list(iter_products(str(data_path), quarantine))
+        assert [p["id"] for p in valid] == [products[0]["id"], products[1]["id"]]
+        assert [q.line for q in quarantine] == [2, 3]
+        assert quarantine[0].errors[0].startswith("JSON inválido")
+        assert quarantine[1].product_id == "5"
+
+    def test_catalog_keeps_previous_data_on_broken_reload(self, tmp_path, sample_data):
+        """Test que un archivo roto en la recarga no interrumpe el servicio"""
+        data_path = tmp_path / "products.json"
+        data_path.write_text(json.dumps(sample_data), encoding="utf-8")
+        catalog = Catalog(str(data_path))
+        catalog.refresh()
+        count = len(catalog)
+
+        data_path.write_text('{"products": [', encoding="utf-8")
+        assert catalog.refresh() is False
+        assert len(catalog) == count
+        assert catalog.get(1001)["id"] == 1001
+
+    def test_snapshot_rows_survive_reload(self, tmp_path, sample_products):
+        """Test que las filas seleccionadas se leen de la misma carga aunque el catálogo se recargue"""
+        products = sample_products
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(json.dumps(p) for p in products), encoding="utf-8")
+        catalog = Catalog(str(data_path))
+        catalog.refresh()
+
+        snapshot = catalog.snapshot
+        rows = snapshot.select(sort_by="price", descending=True)
+        exported = snapshot.products_at(rows)  # Generador: se consume después de la recarga
+
+        data_path.write_text("\n".join(json.dumps(p) for p in products[:5]), encoding="utf-8")
+        os.utime(data_path, ns=(0, 0))
+        assert catalog.refresh() is True
+        assert len(catalog) == 5
+
+        expected = sorted(products, key=lambda p: -p["price"])
+        assert [p["id"] for p in exported] == [p["id"] for p in expected]
+
+    def test_catalog_status_endpoint(self, sample_products):
+        """Test endpoint de estado del catálogo"""
+        response = client.get("/api/v1/catalog/status")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["products_count"] == len(sample_products)
+        assert data["quarantined_count"] == 0
+        assert data["quarantined"] == []
+        assert data["source"] == "products.json"
+
+    def test_catalog_status_paginates_quarantine(self, tmp_path, monkeypatch, sample_products):
+        """Test que el estado pagina la cuarentena y conserva el total"""
+        products = sample_products[:2]
+        lines = [json.dumps(products[0])] + [json.dumps({"id": i}) for i in range(150)]
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(lines), encoding="utf-8")
+        monkeypatch.setattr(catalog_module, "_catalog", Catalog(str(data_path)))
+
+        data = client.get("/api/v1/catalog/status").json()
+        assert data["source"] == "products.ndjson"
+        assert data["products_count"] == 1
+        assert data["quarantined_count"] == 150
+        assert [q["product_id"] for q in data["quarantined"]] == [str(i) for i in range(20)]
+
+        data = client.get("/api/v1/catalog/status?limit=100&offset=140").json()
+        assert [q["line"] for q in data["quarantined"]] == list(range(142, 152))
+        assert client.get("/api/v1/catalog/status?limit=101").status_code == 422
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
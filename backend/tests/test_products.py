@@ -1,6 +1,11 @@
+import csv
+import io
+import json
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app import catalog as catalog_module
+from app.catalog import Catalog
 
 client = TestClient(app)
 
@@ -165,5 +170,68 @@ class TestProductsAPI:
         assert "error" in error_data
         assert "validation_errors" in error_data
 
+    def test_export_products_ndjson(self, sample_products):
+        """Test exportación completa en NDJSON"""
+        response = client.get("/api/v1/products/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        lines = response.text.strip().split("\n")
+        products = [json.loads(line) for line in lines]
+        # La exportación incluye todos los productos del catálogo
+        assert len(products) == len(sample_products)
+        assert products[0]["id"] == 1001
+        assert "seller" in products[0]
+
+    def test_export_products_beyond_pagination_limit(self, tmp_path, monkeypatch, sample_products):
+        """Test exportación de un catálogo con más productos que el límite de paginación (100)"""
+        data_path = tmp_path / "products.ndjson"
+        with open(data_path, 'w', encoding='utf-8') as file:
+            for product_id in range(1, 251):
+                product = dict(sample_products[product_id % len(sample_products)], id=product_id)
+                file.write(json.dumps(product, ensure_ascii=False) + "\n")
+        monkeypatch.setattr(catalog_module, "_catalog", Catalog(str(data_path)))
+
+        response = client.get("/api/v1/products/export?fields=id")
+        assert response.status_code == 200
+        ids = [json.loads(line)["id"] for line in response.text.strip().split("\n")]
+        assert ids == list(range(1, 251))
+
+    def test_export_products_csv_with_fields_and_filters(self):
+        """Test exportación CSV con selección de campos y filtros"""
+        response = client.get(
+            "/api/v1/products/export?format=csv&fields=id,title,seller.name&search=Samsung"
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == ["id", "title", "seller.name"]
+        assert len(rows) > 1
+        for row in rows[1:]:
+            assert "samsung" in row[1].lower()
+
+    def test_export_products_gzip(self):
+        """Test exportación comprimida con gzip"""
+        response = client.get(
+            "/api/v1/products/export?compression=gzip&fields=id",
+            headers={"Accept-Encoding": "identity"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        
+        # httpx descomprime automáticamente según Content-Encoding
+        ids = [json.loads(line)["id"] for line in response.text.strip().split("\n")]
+        assert 1001 in ids
+
+    def test_export_products_invalid_parameters(self):
+        """Test exportación con parámetros inválidos"""
+        response = client.get("/api/v1/products/export?fields=id,nonexistent")
+        assert response.status_code == 400
+        assert "nonexistent" in response.json()["detail"]
+        
+        response = client.get("/api/v1/products/export?format=xml")
+        assert response.status_code == 422
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
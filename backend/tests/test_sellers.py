@@ -0,0 +1,136 @@
+import copy
+import json
+import os
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app import catalog as catalog_module
+from app.catalog import Catalog
+from app.seller_analytics import SellerAnalytics
+
+client = TestClient(app)
+
+class TestSellersAPI:
+
+    def test_get_sellers_success(self):
+        """Test obtener agregados de vendedores"""
+        response = client.get("/api/v1/sellers")
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+        assert len(data) > 0
+
+        seller = data[0]
+        required_fields = ["id", "name", "products_count", "sold_quantity", "gmv",
+                          "average_rating", "rating_distribution", "category_mix"]
+        for field in required_fields:
+            assert field in seller
+
+        # Orden por defecto: GMV descendente
+        gmvs = [s["gmv"] for s in data]
+        assert gmvs == sorted(gmvs, reverse=True)
+
+    def test_get_sellers_aggregates_match_catalog(self, sample_products):
+        """Test que los agregados coinciden con los productos del catálogo"""
+        products = [p for p in sample_products if p["seller"]["id"] == "samsung_official"]
+        response = client.get("/api/v1/sellers?limit=100&sort_by=name")
+        seller = next(s for s in response.json() if s["id"] == "samsung_official")
+
+        assert seller["products_count"] == len(products)
+        assert seller["sold_quantity"] == sum(p["sold_quantity"] for p in products)
+        assert seller["gmv"] == pytest.approx(sum(p["price"] * p["sold_quantity"] for p in products))
+        assert sum(seller["rating_distribution"].values()) == len(products)
+        assert sum(seller["category_mix"].values()) == len(products)
+
+    def test_get_seller_products_success(self):
+        """Test obtener productos de un vendedor"""
+        response = client.get("/api/v1/sellers/samsung_official/products")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        assert all(p["seller_name"] == "Samsung Official" for p in data)
+
+    def test_seller_products_keep_file_order_after_reload(self, tmp_path, monkeypatch, sample_products):
+        """Test que un producto modificado en una recarga conserva su posición del archivo"""
+        products = sample_products
+        seller_id = products[0]["seller"]["id"]
+        expected = [p["id"] for p in products if p["seller"]["id"] == seller_id]
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(json.dumps(p) for p in products), encoding="utf-8")
+        monkeypatch.setattr(catalog_module, "_catalog", Catalog(str(data_path)))
+        assert client.get(f"/api/v1/sellers/{seller_id}/products").status_code == 200
+
+        products[0] = dict(products[0], title="Título modificado")
+        data_path.write_text("\n".join(json.dumps(p) for p in products), encoding="utf-8")
+        os.utime(data_path, ns=(0, 0))
+        response = client.get(f"/api/v1/sellers/{seller_id}/products")
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == expected
+        assert response.json()[0]["title"] == "Título modificado"
+
+        response = client.get(f"/api/v1/sellers/{seller_id}/products?offset=1&limit=1")
+        assert [p["id"] for p in response.json()] == expected[1:2]
+
+    def test_get_seller_products_not_found(self):
+        """Test vendedor inexistente"""
+        response = client.get("/api/v1/sellers/nonexistent/products")
+        assert response.status_code == 404
+        assert "no encontrado" in response.json()["detail"].lower()
+
+    def test_invalid_sort_parameter(self):
+        """Test criterio de orden inválido"""
+        response = client.get("/api/v1/sellers?sort_by=invalid")
+        assert response.status_code == 422
+
+class TestSellerAnalytics:
+
+    def test_incremental_updates_match_full_rebuild(self, sample_products):
+        """Test que agregar y quitar productos equivale a recalcular desde cero"""
+        products = sample_products
+        analytics = SellerAnalytics(products)
+
+        modified = copy.deepcopy(products[0])
+        modified["sold_quantity"] += 100
+        modified["rating"] = 3.5
+        analytics.apply_changes(added=[modified], removed=[products[0], products[1]])
+
+        expected = SellerAnalytics([modified] + products[2:])
+        assert {k: v.to_dict() for k, v in analytics.sellers.items()} == \
+               {k: v.to_dict() for k, v in expected.sellers.items()}
+
+    def test_grouped_by_name_merges_seller_ids(self, sample_products):
+        """Test que los IDs con el mismo nombre se combinan en un solo agregado"""
+        products = sample_products
+        analytics = SellerAnalytics(products)
+        groups = analytics.grouped_by_name()
+
+        names = {p["seller"]["name"] for p in products}
+        assert [g.name for g in groups] == sorted(names, key=str.lower)
+        techstore = next(g for g in groups if g.name == "TechStore Oficial")
+        expected = [p for p in products if p["seller"]["name"] == "TechStore Oficial"]
+        assert techstore.products_count == len(expected)
+        assert techstore.sold_quantity == sum(p["sold_quantity"] for p in expected)
+        assert set(techstore.id.split(", ")) == {p["seller"]["id"] for p in expected}
+        # Los agregados por ID no se modifican
+        assert sum(s.products_count for s in analytics.sellers.values()) == len(products)
+
+    def test_catalog_reload_updates_aggregates(self, tmp_path, sample_products):
+        """Test que la recarga del catálogo (NDJSON) actualiza los agregados"""
+        products = sample_products
+        data_path = tmp_path / "products.ndjson"
+        data_path.write_text("\n".join(json.dumps(p) for p in products), encoding="utf-8")
+
+        catalog = Catalog(str(data_path))
+        assert catalog.refresh() is True
+        assert catalog.refresh() is False  # Sin cambios en disco no se recarga
+        seller_id = products[0]["seller"]["id"]
+        count = catalog.sellers.get(seller_id).products_count
+
+        data_path.write_text("\n".join(json.dumps(p) for p in products[1:]), encoding="utf-8")
+        os.utime(data_path, ns=(0, 0))  # Garantizar una firma distinta del archivo
+        assert catalog.refresh() is True
+        assert len(catalog) == len(products) - 1
+        assert catalog.sellers.get(seller_id).products_count == count - 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])